@@ -0,0 +1,86 @@
+"""
+Startup Benchmark for Image Text Translator
+
+This script measures how long the command-line tool takes to start up using
+`python -X importtime`, and checks that the heavy OCR/translation modules are
+not imported for invocations that never process an image.
+
+Usage:
+python benchmark_startup.py
+python benchmark_startup.py --budget-ms 100
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "image_text_translator.py")
+
+# Modules that must only be imported when an image is actually processed
+HEAVY_MODULES = ("PIL", "pytesseract", "googletrans", "httpx")
+
+# Command-line invocations that should never load the heavy modules
+SCENARIOS = [
+    ("--help", ["--help"]),
+    ("argument error", []),
+    ("missing file", ["does_not_exist.png"]),
+]
+
+def measure_import_time(args):
+    """
+    Run the CLI under `python -X importtime` and parse its report.
+
+    Args:
+        args (list): Command-line arguments passed to the CLI
+
+    Returns:
+        tuple: Total import time in milliseconds and the set of top-level
+            packages that were imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", SCRIPT] + args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+    total_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        total_us += int(fields[0])
+        imported.add(fields[2].strip().split(".")[0])
+
+    return total_us / 1000.0, imported
+
+def main():
+    parser = argparse.ArgumentParser(description="Report CLI import-time budget.")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="maximum allowed total import time in milliseconds")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'Scenario':<20}{'Import time':>14}  Heavy modules loaded")
+    print("-" * 70)
+    for name, cli_args in SCENARIOS:
+        total_ms, imported = measure_import_time(cli_args)
+        heavy = sorted(m for m in HEAVY_MODULES if m in imported)
+
+        print(f"{name:<20}{total_ms:>11.1f} ms  {', '.join(heavy) or '-'}")
+        if heavy or total_ms > args.budget_ms:
+            failed = True
+    print("-" * 70)
+
+    if failed:
+        print(f"FAIL: budget is {args.budget_ms:.0f} ms with no heavy modules loaded")
+        sys.exit(1)
+    print(f"OK: all scenarios within {args.budget_ms:.0f} ms budget")
+
+if __name__ == "__main__":
+    main()
@@ -16,16 +16,29 @@ Requirements:
 Usage:
 python image_text_translator.py <path_to_image>
 python image_text_translator.py --folder <path_to_folder>
+
+The OCR and translation libraries are imported lazily, only when an image is
+actually processed, so `--help` and argument errors return immediately.
 """
 
-import sys
+import argparse
 import os
-from PIL import Image
-import pytesseract
-from googletrans import Translator
 
-# Uncomment and modify the line below if Tesseract is not in your PATH (Windows)
-# pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+def _load_ocr():
+    """
+    Import the OCR stack on first use.
+
+    Returns:
+        tuple: The PIL ``Image`` module and the ``pytesseract`` module
+    """
+    from PIL import Image
+    import pytesseract
+
+    # Uncomment and modify the line below if Tesseract is not in your PATH (Windows)
+    # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+    return Image, pytesseract
 
 def extract_text_from_image(image_path):
     """
@@ -38,6 +51,8 @@ def extract_text_from_image(image_path):
         str: Extracted text from the image
     """
     try:
+        Image, pytesseract = _load_ocr()
+
         # Open the image
         img = Image.open(image_path)
 
@@ -60,6 +75,9 @@ def translate_text_to_korean(text):
         str: Translated text in Korean
     """
     try:
+        # googletrans pulls in httpx, so only import it when translating
+        from googletrans import Translator
+
         # Initialize the translator
         translator = Translator()
 
@@ -128,16 +146,27 @@ def process_single_image(image_path):
     print(translated_text)
     print("-" * 50)
 
-def main():
-    # Check if arguments are provided
-    if len(sys.argv) < 2:
-        print("Usage: python image_text_translator.py <path_to_image>")
-        print("       python image_text_translator.py --folder <path_to_folder>")
-        return
+def build_parser():
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser for the command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description="Extract text from images and translate it to Korean.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("image", nargs="?", help="path to a single image file")
+    group.add_argument("--folder", metavar="FOLDER",
+                       help="process all images in the given folder")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
 
     # Check if processing a folder
-    if sys.argv[1] == "--folder" and len(sys.argv) >= 3:
-        folder_path = sys.argv[2]
+    if args.folder is not None:
+        folder_path = args.folder
 
         # Check if the folder exists
         if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
@@ -160,7 +189,7 @@ def main():
 
     else:
         # Process a single image
-        image_path = sys.argv[1]
+        image_path = args.image
 
         # Check if the file exists
         if not os.path.exists(image_path):